@@ -2,28 +2,40 @@
 
 """HDA history."""
 
+import bisect
+import hashlib
+import io
+import json
 import logging
 import os
 import re
 import subprocess
-import time
-from datetime import datetime
-
+from concurrent.futures import ThreadPoolExecutor
+
+import hou
+
+from PySide2.QtCore import (
+    QAbstractTableModel,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Qt,
+    Signal,
+    Slot,
+)
 from PySide2.QtWidgets import (
-    QApplication,
+    QAbstractItemView,
+    QFormLayout,
     QHBoxLayout,
     QHeaderView,
-    QLabel,
     QLineEdit,
     QPlainTextEdit,
-    QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from git import Repo
+from git import GitCommandError, Repo
 
 from rbl_pipe_hdamanager import utilities
 
@@ -32,6 +44,10 @@ from rbl_pipe_houdini.utils import nodes
 
 logger = logging.getLogger(__name__)
 
+# regex used to process git history
+_HDA_VER_RE = re.compile(r"^\+Operator:(.*)$", re.M)
+_DIFF_COMMIT_RE = re.compile(r"commit ([0-9a-f]{40})$")
+
 
 class HDAHistory(object):
     """HDA Release History."""
@@ -39,6 +55,9 @@ class HDAHistory(object):
     __config = utilities.get_config()
     hda_repo = __config.get("hda_repo")
     history_ui = None
+    # Workers still running, kept so they aren't garbage collected mid-run
+    history_receivers = set()
+    history_pool = None
 
     def __init__(
         self,
@@ -56,7 +75,12 @@ class HDAHistory(object):
         self.node = node
         self.manager = manager
         self.package_history = []
+        self.package_timestamps = []
         self.history = []
+        self._repo = None
+        self._hda_dir = None
+        self._section_paths = {}
+        self._cache_path = None
 
     def history_dir(self):
         """
@@ -67,6 +91,28 @@ class HDAHistory(object):
         """
         return os.path.join(self.manager.edit_dir, ".history")
 
+    def cache_path(self):
+        """
+        Get the path to the cached history for this HDA release.
+
+        The history for a given node type at a given release commit never changes, so
+        it is cached on disk to avoid repeating the git walk.
+
+        Returns:
+            (str): The path to the cache file.
+        """
+        if self._cache_path is None:
+            key = "{name}:{commit}".format(
+                name=self.node.type().name(),
+                commit=self.repo().commit_hash,
+            )
+            self._cache_path = os.path.join(
+                self.manager.edit_dir,
+                ".history_cache",
+                "{key}.json".format(key=hashlib.sha1(key.encode("utf-8")).hexdigest()),
+            )
+        return self._cache_path
+
     def package_dir(self):
         """Get the HDA history package.
 
@@ -89,10 +135,11 @@ class HDAHistory(object):
         Returns:
             hda_dir(str): The HDA directory.
         """
-        definition = nodes.definition_from_node(self.node.path())
-        hda_name = utilities.expanded_hda_name(definition)
-        hda_dir = os.path.join(self.package_dir(), "hda", hda_name)
-        return hda_dir
+        if self._hda_dir is None:
+            definition = nodes.definition_from_node(self.node.path())
+            hda_name = utilities.expanded_hda_name(definition)
+            self._hda_dir = os.path.join(self.package_dir(), "hda", hda_name)
+        return self._hda_dir
 
     def section_path(self, section):
         """
@@ -107,6 +154,9 @@ class HDAHistory(object):
         Raises:
             RuntimeError: Invalid section found.
         """
+        if section in self._section_paths:
+            return self._section_paths[section]
+
         hda_dir = self.hda_dir()
         if os.path.exists(hda_dir):
             definition_dirs = [
@@ -124,6 +174,7 @@ class HDAHistory(object):
                 definition_dirs[0],
                 section,
             )
+            self._section_paths[section] = section_path
             return section_path
         else:
             raise RuntimeError("HDA definition directory not found.")
@@ -134,28 +185,20 @@ class HDAHistory(object):
         Returns:
             repo(HDARepo): The instance of repo for the current node type name.
         """
-        namespace = utilities.node_type_namespace(self.node.type().name())
-        repo = self.manager.repo_from_namespace(namespace)
-        return repo
+        if self._repo is None:
+            namespace = utilities.node_type_namespace(self.node.type().name())
+            self._repo = self.manager.repo_from_namespace(namespace)
+        return self._repo
 
     def release_history(self):
         """Show release history.
 
+        The history is generated from git in a background thread so that Houdini
+        remains responsive, and the UI is shown once it is ready.
+
         Raises:
             RuntimeError: Valid repository couldn't be found.
         """
-        # Clone the repo ready to check the history
-        if os.path.isdir(self.history_dir()):
-            cloned_repo = Repo(self.history_dir())
-        else:
-            repo = Repo(self.hda_repo)
-            cloned_repo = repo.clone(self.history_dir())
-
-        # Pull the latest master
-        cloned_repo.git.checkout("master")
-        cloned_repo.git.pull()
-
-        # Checkout the relevant commit
         repo = self.repo()
         if not repo:
             raise RuntimeError(
@@ -163,189 +206,236 @@ class HDAHistory(object):
                     name=self.node.type().name(),
                 )
             )
-        cloned_repo.git.checkout(repo.commit_hash)
 
-        # Generate the history for this HDA from git
-        self.update_package_history()
-        self.update_hda_history()
+        # Resolve anything that needs hou up front, as it can't be used from the
+        # worker thread.
+        self.hda_dir()
+        self.cache_path()
+
+        # Every run checks out into the same clone, so run them one at a time
+        if HDAHistory.history_pool is None:
+            HDAHistory.history_pool = QThreadPool()
+            HDAHistory.history_pool.setMaxThreadCount(1)
+
+        # The receiver is created here on the main thread, so the results are
+        # delivered to it there rather than on the pool thread.
+        worker = HDAHistoryWorker(self)
+        HDAHistory.history_receivers.add(HDAHistoryReceiver(self, worker))
+        HDAHistory.history_pool.start(worker)
+
+    def update_history(self):
+        """Generate the history for this HDA from git."""
+        # Use the cached history if this release has been loaded before
+        cache_path = self.cache_path()
+        if os.path.isfile(cache_path):
+            with open(cache_path, "r") as cache_file:
+                self.history = json.load(cache_file)
+            logger.debug("Loaded HDA history from {path}".format(path=cache_path))
+            return
+
+        # Clone the repo ready to check the history
+        if os.path.isdir(self.history_dir()):
+            cloned_repo = Repo(self.history_dir())
+        else:
+            repo = Repo(self.hda_repo)
+            cloned_repo = repo.clone(self.history_dir(), no_checkout=True)
+
+        # Only fetch if the release commit isn't already in the clone. The history
+        # walk needs the full history, so this can't be a shallow fetch.
+        commit_hash = self.repo().commit_hash
+        try:
+            cloned_repo.git.cat_file(
+                "-e", "{commit}^{{commit}}".format(commit=commit_hash)
+            )
+        except GitCommandError:
+            cloned_repo.remotes.origin.fetch()
+
+        # Checkout the relevant commit
+        cloned_repo.git.checkout(commit_hash)
+
+        # Generate the history for this HDA from git. The package and HDA histories
+        # are independent so read them concurrently.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.update_package_history),
+                executor.submit(self.update_hda_history),
+            ]
+            for future in futures:
+                future.result()
+        self.complete_package_versions()
         self.complete_node_versions()
 
-        HDAHistory.history_ui = HDAHistoryUI(self.history, self.node.type().name())
+        self.write_cache()
+
+    def write_cache(self):
+        """Write the generated history to the cache."""
+        cache_path = self.cache_path()
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+        # Write to a temporary file first so a partially written cache is never read
+        temp_path = "{path}.tmp".format(path=cache_path)
+        with open(temp_path, "w") as cache_file:
+            json.dump(self.history, cache_file)
+        os.replace(temp_path, cache_path)
+        logger.debug("Cached HDA history to {path}".format(path=cache_path))
+
+    def show_history(self, history):
+        """Show the release history UI.
+
+        Args:
+            history(list): A list of dictionaries containing information about a node
+                types history.
+        """
+        HDAHistory.history_ui = HDAHistoryUI(history, self.node.type().name())
         HDAHistory.history_ui.show()
 
+    def show_error(self, message):
+        """Report a failure to generate the release history.
+
+        Args:
+            message(str): The error message.
+        """
+        hou.ui.displayMessage(
+            "Failed to load HDA release history: {message}".format(message=message),
+            title="HDA Manager: Release History",
+            severity=hou.severityType.Error,
+        )
+
     def update_package_history(self):
         """Read the git history for the package.py."""
-        package_dir = self.package_dir()
-
-        # Change into the git repo so that it is possible to run git log etc.
-        os.chdir(package_dir)
-
-        # regex used to process git history
-        split_regex = re.compile("commit (.{40})")
-        tag_regex = re.compile("(tag: .*),")
-        date_regex = re.compile("Date:(.*)")
-
-        # Run git log on the package.py to get details of any updates
-        package_path = os.path.join(package_dir, "package.py")
-        log = subprocess.check_output(
-            "git log --decorate=True -- {path}".format(
-                path=package_path,
-            ),
-            shell=True,
-        ).decode("utf-8")
-
-        i = 0
-        for log_split in split_regex.split(log):
-            if not log_split:
-                continue
-            record = {}
-
-            # Skip the commit hashes but process all of the other entries
-            if i % 2 == 1:
-                date = None
-
-                # look for any tags in the log
-                match_tags = tag_regex.search(log_split)
-
-                if match_tags:
-                    # process tags and add to dictionary
-                    tags = []
-                    for match in match_tags.group(0).split(","):
-                        tag = match.strip()
-                        if tag.startswith("tag: "):
-                            tags.append(tag[5:])
-                    record["tags"] = tags
-
-                    # look for a date in the log
-                    match_date = date_regex.search(log_split)
-                    if match_date:
-                        # convert date to timestamp and add to dict
-                        date = match_date.group(1).strip()
-                        record["timestamp"] = time.mktime(
-                            datetime.strptime(
-                                date[:-6],
-                                "%a %b %d %H:%M:%S %Y",
-                            ).timetuple()
-                        )
-
-                    # Keep track of each entry from the log
-                    self.package_history.append(record)
-            i += 1
+        cloned_repo = Repo(self.history_dir())
+
+        # Map the tags onto the commits they point to
+        commit_tags = {}
+        for tag in cloned_repo.tags:
+            commit_tags.setdefault(tag.commit.hexsha, []).append(tag.name)
+
+        # Walk the commits on the package.py to get details of any updates
+        package_path = os.path.join(self.package_dir(), "package.py")
+        commit_hash = self.repo().commit_hash
+        for commit in cloned_repo.iter_commits(commit_hash, paths=package_path):
+            tags = commit_tags.get(commit.hexsha)
+            if tags:
+                record = {}
+                record["tags"] = tags
+                record["timestamp"] = commit.authored_date
+
+                # Keep track of each entry from the log
+                self.package_history.append(record)
+
+        # Sort the releases so they can be searched by timestamp
+        self.package_history.sort(key=lambda k: k["timestamp"])
+        self.package_timestamps = [pkg["timestamp"] for pkg in self.package_history]
 
     def update_hda_history(self):
         """Read the git history for the HDA."""
         hda_dir = self.hda_dir()
+        cloned_repo = Repo(self.history_dir())
 
-        # Change into the git repo so that it is possible to run git log etc.
-        os.chdir(hda_dir)
+        # Diff the INDEX__SECTION within the hda as we know this will be written on
+        # each publish
+        index_path = os.path.join(hda_dir, "INDEX__SECTION")
+        python_path = self.section_path("PythonModule")
+        diffs = self.commit_diffs(index_path, python_path)
 
-        repo = self.repo()
+        for commit in cloned_repo.iter_commits(self.repo().commit_hash, paths=hda_dir):
+            record = {}
+            commit_diffs = diffs.get(commit.hexsha, {})
+
+            # Extract the node version from the index file diff
+            ver = None
+            match_ver = _HDA_VER_RE.search(commit_diffs.get(index_path, ""))
+            if match_ver:
+                ver = match_ver.group(1).strip()
+
+            # Add the author, date, comment and the commit hash
+            record["author"] = commit.author.name
+            record["date"] = commit.authored_datetime.strftime(
+                "%a %b %d %H:%M:%S %Y %z"
+            )
+            record["comment"] = commit.message.strip()
+            record["commit"] = commit.hexsha
+            record["timestamp"] = commit.authored_date
 
-        # regex used to process git history
-        split_regex = re.compile("commit (.{40})")
-        hda_ver_regex = re.compile("\+Operator:(.*)")
-        author_regex = re.compile("Author:(.*)<")
-        date_regex = re.compile("Date:(.*)")
+            # Add the PythonModule diff to dict
+            record["python_diff"] = commit_diffs.get(python_path, "")
 
-        # Run git log on the INDEX__SECTION within the hda as we know this will
-        # be written on each publish
-        index_path = os.path.join(hda_dir, "INDEX__SECTION")
-        log = subprocess.check_output(
-            "git log --decorate=True -- {path}".format(
-                path=hda_dir,
-            ),
-            shell=True,
-        ).decode("utf-8")
-
-        i = 0
-        ver = None
-        commit = None
-        for log_split in split_regex.split(log):
-            if not log_split:
-                continue
+            # Add the nodeTypeName
+            if ver:
+                record["node_version"] = ver
 
-            record = {}
-            # Process the commit hash
-            if i % 2 == 0:
-                # diff the index file in order to extract the node version
-                diff = subprocess.check_output(
-                    "git diff {commit}~ {commit} -- {path}".format(
-                        commit=log_split,
-                        path=index_path,
-                    ),
-                    shell=True,
-                ).decode("utf-8")
-                # keep track of the commit hash so we can add it to our history
-                # data later
-                commit = log_split
-
-                for line in diff.split("\n"):
-                    match_ver = hda_ver_regex.search(line)
-                    if match_ver:
-                        ver = match_ver.group(1).strip()
-
-            # Process the rest of the log
-            else:
-                author = None
-                date = None
-                comment = []
-
-                # Try and extract the author, data and comment
-                for line in log_split.split("\n"):
-                    match_author = author_regex.search(line)
-                    match_date = date_regex.search(line)
-                    if match_author:
-                        author = match_author.group(1).strip()
-                    elif match_date:
-                        date = match_date.group(1).strip()
-                    else:
-                        if line:
-                            comment.append(line)
-
-                # Check if we have enough data to create a record for this hda
-                if author and date:
-                    # Add the author, date, comment and the commit hash
-                    record["author"] = author
-                    record["date"] = date
-                    record["comment"] = "".join(comment).strip()
-                    record["commit"] = commit
-
-                    # Calculate and add the timestamp
-                    timestamp = time.mktime(
-                        datetime.strptime(date[:-6], "%a %b %d %H:%M:%S %Y").timetuple()
-                    )
-                    record["timestamp"] = timestamp
-
-                    # Diff the PythonModule and add to dict
-                    python_diff = subprocess.check_output(
-                        "git diff {commit}~ {commit} -- {path}".format(
-                            commit=commit, path=self.section_path("PythonModule")
-                        ),
-                        shell=True,
-                    ).decode("utf-8")
-                    record["python_diff"] = python_diff
-
-                    # Add the package version from the package_history
-                    package_releases = [
-                        pkg
-                        for pkg in sorted(
-                            self.package_history, key=lambda k: k["timestamp"]
-                        )
-                        if pkg.get("timestamp") > timestamp
-                    ]
-                    if package_releases:
-                        tags = package_releases[0].get("tags")
-                        for tag in tags:
-                            if tag.startswith(repo.package_name):
-                                record["package_version"] = tag
-
-                    # Add the nodeTypeName
-                    if ver:
-                        record["node_version"] = ver
-                        ver = None
-
-                self.history.append(record)
-            i += 1
+            self.history.append(record)
+
+    def commit_diffs(self, *paths):
+        """Get the diffs introduced by each commit for the given paths.
+
+        A single git log is run for all of the paths rather than diffing each commit
+        individually.
+
+        Args:
+            *paths(str): The paths to get the diffs for.
+
+        Returns:
+            diffs(dict): A dictionary of diffs keyed by commit hash, each containing a
+                dictionary of diffs keyed by path.
+        """
+        # Stream the log so it is parsed while git is still writing it
+        process = subprocess.Popen(
+            ["git", "log", "-p", "--format=commit %H", self.repo().commit_hash, "--"]
+            + list(paths),
+            cwd=self.history_dir(),
+            stdout=subprocess.PIPE,
+        )
+
+        names = {path: "/" + os.path.basename(path) for path in paths}
+        diffs = {}
+        commit_diffs = {}
+        diff_lines = None
+        with io.TextIOWrapper(process.stdout, encoding="utf-8") as log:
+            for line in log:
+                match_commit = _DIFF_COMMIT_RE.match(line)
+                if match_commit:
+                    # Start of the diffs for the next commit
+                    commit_diffs = diffs.setdefault(match_commit.group(1), {})
+                    diff_lines = None
+                    continue
+
+                if line.startswith("diff --git "):
+                    # Start of the diff for the next file, only keep the paths
+                    # we are interested in
+                    diff_lines = None
+                    header = line.rstrip("\n")
+                    for path, name in names.items():
+                        if header.endswith(name):
+                            diff_lines = commit_diffs.setdefault(path, [])
+
+                if diff_lines is not None:
+                    diff_lines.append(line)
+
+        process.wait()
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, process.args)
+
+        for commit_diffs in diffs.values():
+            for path, diff_lines in commit_diffs.items():
+                commit_diffs[path] = "".join(diff_lines)
+
+        return diffs
+
+    def complete_package_versions(self):
+        """Add the package versions.
+
+        Each HDA update is released in the first package version tagged after it was
+        committed.
+        """
+        package_name = self.repo().package_name
+        for record in self.history:
+            index = bisect.bisect_right(self.package_timestamps, record["timestamp"])
+            if index < len(self.package_history):
+                tags = self.package_history[index].get("tags")
+                for tag in tags:
+                    if tag.startswith(package_name):
+                        record["package_version"] = tag
 
     def complete_node_versions(self):
         """Add missing node versions.
@@ -366,6 +456,158 @@ class HDAHistory(object):
                 logger.warning("No node version data found.")
 
 
+class HDAHistorySignals(QObject):
+    """Signals emitted by the HDAHistoryWorker."""
+
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class HDAHistoryWorker(QRunnable):
+    """Generate the HDA Release History away from the main thread."""
+
+    def __init__(self, hda_history):
+        """
+        Create an instance of the HDA History worker.
+
+        Args:
+            hda_history(HDAHistory): The HDAHistory to generate the history for.
+        """
+        super(HDAHistoryWorker, self).__init__()
+        self.setAutoDelete(False)
+        self.hda_history = hda_history
+        self.signals = HDAHistorySignals()
+
+    def run(self):
+        """Generate the history, emitting the result once complete."""
+        try:
+            self.hda_history.update_history()
+        except Exception as e:
+            logger.exception("Failed to generate HDA release history.")
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(self.hda_history.history)
+
+
+class HDAHistoryReceiver(QObject):
+    """Receive the HDAHistoryWorker results on the main thread."""
+
+    def __init__(self, hda_history, worker):
+        """
+        Create an instance of the HDA History receiver.
+
+        Args:
+            hda_history(HDAHistory): The HDAHistory the history is generated for.
+            worker(HDAHistoryWorker): The worker generating the history.
+        """
+        super(HDAHistoryReceiver, self).__init__()
+        self.hda_history = hda_history
+        self.worker = worker
+        worker.signals.finished.connect(self.finished, Qt.QueuedConnection)
+        worker.signals.failed.connect(self.failed, Qt.QueuedConnection)
+
+    @Slot(object)
+    def finished(self, history):
+        """Release the finished worker and show the release history.
+
+        Args:
+            history(list): A list of dictionaries containing information about a node
+                types history.
+        """
+        HDAHistory.history_receivers.discard(self)
+        self.hda_history.show_history(history)
+
+    @Slot(str)
+    def failed(self, message):
+        """Release the failed worker and report the error.
+
+        Args:
+            message(str): The error message.
+        """
+        HDAHistory.history_receivers.discard(self)
+        self.hda_history.show_error(message)
+
+
+class HDAHistoryModel(QAbstractTableModel):
+    """Table model exposing the HDA Release History to a view."""
+
+    columns = [
+        "author",
+        "date",
+        "comment",
+    ]
+
+    def __init__(self, history, parent=None):
+        """
+        Create an instance of the HDA History model.
+
+        Args:
+            history(list): A list of dictionaries containing information about a node
+                types history.
+            parent(:obj:`QObject`,optional): The parent object.
+        """
+        super(HDAHistoryModel, self).__init__(parent)
+        self.history = history
+
+    def rowCount(self, parent=None):
+        """
+        Get the number of rows in the model.
+
+        Args:
+            parent(:obj:`QModelIndex`,optional): The parent index.
+
+        Returns:
+            (int): The number of history records.
+        """
+        return len(self.history)
+
+    def columnCount(self, parent=None):
+        """
+        Get the number of columns in the model.
+
+        Args:
+            parent(:obj:`QModelIndex`,optional): The parent index.
+
+        Returns:
+            (int): The number of columns displayed.
+        """
+        return len(self.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Get the data to display for the given index.
+
+        Args:
+            index(QModelIndex): The index of the cell to get the data for.
+            role(:obj:`Qt.ItemDataRole`,optional): The role the data is requested for.
+
+        Returns:
+            (str): The history value for the cell, or None.
+        """
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self.history[index.row()].get(self.columns[index.column()])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Get the header label for the given section.
+
+        Args:
+            section(int): The row or column number.
+            orientation(Qt.Orientation): The header orientation.
+            role(:obj:`Qt.ItemDataRole`,optional): The role the data is requested for.
+
+        Returns:
+            (str): The header label, or None.
+        """
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section]
+        return str(section + 1)
+
+
 class HDAHistoryUI(QWidget):
     """HDA Release History UI."""
 
@@ -403,158 +645,103 @@ class HDAHistoryUI(QWidget):
                 name=self.node_type_name,
             )
         )
-        columns = [
-            "author",
-            "date",
-            "comment",
-            "",
-        ]
-
-        row_count = len(self.history)
-        column_count = len(columns)
-
         main_layout = QHBoxLayout()
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(column_count)
-        self.table.setRowCount(row_count)
-
-        self.table.setHorizontalHeaderLabels(columns)
+        # The model is only queried for the cells in view, so there is no need to
+        # create items for each row of the history up front.
+        self.model = HDAHistoryModel(self.history)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
 
         self.table.setColumnWidth(0, 150)
         self.table.setColumnWidth(1, 250)
-        self.table.setColumnWidth(2, 600)
-        self.table.setColumnWidth(3, 100)
+        self.table.setColumnWidth(2, 700)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
-        for row in range(row_count):  # add items from array to QTableWidget
-            for column in range(column_count):
-                column_text = columns[column]
-                if column_text == "":
-                    self.details = QPushButton("Details")
-                    self.details.clicked.connect(self.handle_details_clicked)
-                    self.table.setCellWidget(row, column, self.details)
-                else:
-                    item = self.history[row].get(column_text)
-                    self.table.setItem(row, column, QTableWidgetItem(item))
+        self.table.selectionModel().currentRowChanged.connect(
+            self.handle_current_row_changed
+        )
 
         main_layout.addWidget(self.table)
 
-        details_layout = QVBoxLayout()
-
-        # Author
-        author_layout = QHBoxLayout()
-        author_label = QLabel("Author")
-        author_label.setFixedWidth(100)
-        self.author_field = QLineEdit()
-        self.author_field.setReadOnly(True)
-        self.author_field.setFixedWidth(600)
-        author_layout.addWidget(author_label)
-        author_layout.addWidget(self.author_field)
-        details_layout.addLayout(author_layout)
-
-        # Date
-        date_layout = QHBoxLayout()
-        date_label = QLabel("Date")
-        date_label.setFixedWidth(100)
-        self.date_field = QLineEdit()
-        self.date_field.setReadOnly(True)
-        self.date_field.setFixedWidth(600)
-        date_layout.addWidget(date_label)
-        date_layout.addWidget(self.date_field)
-        details_layout.addLayout(date_layout)
-
-        # Timestamp
-        timestamp_layout = QHBoxLayout()
-        timestamp_label = QLabel("Timestamp")
-        timestamp_label.setFixedWidth(100)
-        self.timestamp_field = QLineEdit()
-        self.timestamp_field.setReadOnly(True)
-        self.timestamp_field.setFixedWidth(600)
-        timestamp_layout.addWidget(timestamp_label)
-        timestamp_layout.addWidget(self.timestamp_field)
-        details_layout.addLayout(timestamp_layout)
-
-        # Comment
-        comment_layout = QHBoxLayout()
-        comment_label = QLabel("Comment")
-        comment_label.setFixedWidth(100)
-        self.comment_field = QLineEdit()
-        self.comment_field.setReadOnly(True)
-        self.comment_field.setFixedWidth(600)
-        comment_layout.addWidget(comment_label)
-        comment_layout.addWidget(self.comment_field)
-        details_layout.addLayout(comment_layout)
-
-        # NodeTypeName
-        version_layout = QHBoxLayout()
-        version_label = QLabel("Version")
-        version_label.setFixedWidth(100)
-        self.version_field = QLineEdit()
-        self.version_field.setReadOnly(True)
-        self.version_field.setFixedWidth(600)
-        version_layout.addWidget(version_label)
-        version_layout.addWidget(self.version_field)
-        details_layout.addLayout(version_layout)
-
-        # Package version
-        package_layout = QHBoxLayout()
-        package_label = QLabel("Package")
-        package_label.setFixedWidth(100)
-        self.package_field = QLineEdit()
-        self.package_field.setReadOnly(True)
-        self.package_field.setFixedWidth(600)
-        package_layout.addWidget(package_label)
-        package_layout.addWidget(self.package_field)
-        details_layout.addLayout(package_layout)
-
-        # Commit
-        commit_layout = QHBoxLayout()
-        commit_label = QLabel("Commit")
-        commit_label.setFixedWidth(100)
-        self.commit_field = QLineEdit()
-        self.commit_field.setReadOnly(True)
-        self.commit_field.setFixedWidth(600)
-        commit_layout.addWidget(commit_label)
-        commit_layout.addWidget(self.commit_field)
-        details_layout.addLayout(commit_layout)
-
-        # PythonDiff
-        python_layout = QHBoxLayout()
-        python_label = QLabel("Python Diff")
-        python_label.setFixedWidth(100)
-        self.python_field = QPlainTextEdit()
-        self.python_field.setReadOnly(True)
-        self.python_field.setFixedWidth(600)
-        python_layout.addWidget(python_label)
-        python_layout.addWidget(self.python_field)
-        details_layout.addLayout(python_layout)
-
-        main_layout.addLayout(details_layout)
+        # Details
+        self.details = QWidget()
+        details_layout = QFormLayout()
+        self.details.setLayout(details_layout)
+
+        self.author_field = self.__add_field(details_layout, "Author")
+        self.date_field = self.__add_field(details_layout, "Date")
+        self.timestamp_field = self.__add_field(details_layout, "Timestamp")
+        self.comment_field = self.__add_field(details_layout, "Comment")
+        self.version_field = self.__add_field(details_layout, "Version")
+        self.package_field = self.__add_field(details_layout, "Package")
+        self.commit_field = self.__add_field(details_layout, "Commit")
+        self.python_field = self.__add_field(
+            details_layout, "Python Diff", field=QPlainTextEdit()
+        )
+
+        # The history keys displayed by each field
+        self.detail_fields = [
+            ("author", self.author_field),
+            ("date", self.date_field),
+            ("timestamp", self.timestamp_field),
+            ("comment", self.comment_field),
+            ("node_version", self.version_field),
+            ("package_version", self.package_field),
+            ("commit", self.commit_field),
+        ]
+
+        main_layout.addWidget(self.details)
 
         self.layout().addLayout(main_layout)
 
         self.resize(1920, 800)
 
-    def handle_details_clicked(self):
-        """Handle when the details button in the UI is clicked."""
-        button = QApplication.focusWidget()
-        index = self.table.indexAt(button.pos())
-        if index.isValid():
-            self.update_details(index.row())
+    def handle_current_row_changed(self, current, previous):
+        """Handle when the current row in the UI changes.
+
+        This covers selecting a row with either the mouse or the keyboard.
+
+        Args:
+            current(QModelIndex): The model index of the new current cell.
+            previous(QModelIndex): The model index of the previous current cell.
+        """
+        if current.isValid():
+            self.update_details(current.row())
+
+    def __add_field(self, layout, label, field=None):
+        """
+        Add a read-only field to the details layout.
+
+        Args:
+            layout(QFormLayout): The layout to add the field to.
+            label(str): The label for the field.
+            field(:obj:`QWidget`,optional): The field widget, a QLineEdit by default.
+
+        Returns:
+            field(QWidget): The field widget added.
+        """
+        if field is None:
+            field = QLineEdit()
+        field.setReadOnly(True)
+        field.setFixedWidth(600)
+        layout.addRow(label, field)
+        return field
 
     def update_details(self, index):
         """
         Update the details side panel based on which index is selected.
 
+        Updates are disabled while the fields are filled so the panel is only
+        repainted once.
+
         Args:
             index(int): The index of the row that was clicked.
         """
-        self.author_field.setText(str(self.history[index].get("author")))
-        self.date_field.setText(str(self.history[index].get("date")))
-        self.timestamp_field.setText(str(self.history[index].get("timestamp")))
-        self.comment_field.setText(str(self.history[index].get("comment")))
-        self.version_field.setText(str(self.history[index].get("node_version")))
-        self.package_field.setText(str(self.history[index].get("package_version")))
-        self.commit_field.setText(str(self.history[index].get("commit")))
-        self.python_field.setPlainText(str(self.history[index].get("python_diff")))
+        record = self.history[index]
+        self.details.setUpdatesEnabled(False)
+        for key, field in self.detail_fields:
+            field.setText(str(record.get(key)))
+        self.python_field.setPlainText(str(record.get("python_diff")))
+        self.details.setUpdatesEnabled(True)
@@ -9,8 +9,6 @@ import time
 
 import hou
 
-from packaging.version import parse
-
 import pyblish.api
 
 from rbl_pipe_hdamanager import history
@@ -417,7 +415,9 @@ class HDAManager(object):
         )
         versions = []
         if nodetype:
-            versions = [parse(version) for version in nodetype.versions.keys()]
+            versions = [
+                utilities.parse_version(version) for version in nodetype.versions.keys()
+            ]
 
         # Also need to consider any HDAs that have been released to the current project
         # but using the same namespace.
@@ -425,7 +425,10 @@ class HDAManager(object):
             category, namespace, name, project_repo=True
         )
         if project_nodetype:
-            versions += [parse(version) for version in project_nodetype.versions.keys()]
+            versions += [
+                utilities.parse_version(version)
+                for version in project_nodetype.versions.keys()
+            ]
 
         if not versions:
             return None
@@ -450,13 +453,18 @@ class HDAManager(object):
 
         # If nodetype exists check that it is the latest version
         if nodetype:
-            versions = [parse(version) for version in nodetype.all_versions().keys()]
+            versions = [
+                utilities.parse_version(version)
+                for version in nodetype.all_versions().keys()
+            ]
             versions_sorted = sorted(versions, reverse=True)
             latest_version = versions_sorted[0]
 
             # get current version
             nodeTypeName = definition.nodeTypeName()
-            current_version = parse(utilities.node_type_version(nodeTypeName))
+            current_version = utilities.parse_version(
+                utilities.node_type_version(nodeTypeName)
+            )
 
             # compare versions
             if current_version < latest_version:
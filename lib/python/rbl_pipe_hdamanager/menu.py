@@ -11,6 +11,8 @@ from rbl_pipe_houdini.utils import nodes
 
 logger = logging.getLogger(__name__)
 
+_EDIT_DIR = None
+
 
 def get_hda_manager():
     """Find the HDAManager instance stored in the current Houdini session.
@@ -21,21 +23,35 @@ def get_hda_manager():
     return manager.HDAManager.init()
 
 
-def in_edit_directory(current_node):
+def edit_dir():
+    """Get the HDAManager edit directory.
+
+    The edit directory is fixed for the session, so it is looked up from the manager
+    once rather than on every menu check.
+
+    Returns:
+        (str): The HDAManager edit directory.
+    """
+    global _EDIT_DIR
+    if _EDIT_DIR is None:
+        _EDIT_DIR = get_hda_manager().edit_dir
+    return _EDIT_DIR
+
+
+def in_edit_directory(current_node, definition=None):
     """Check if the current_node definition is located in the HDAManager edit directory.
 
     Args:
         current_node(hou.Node): Check if definition is in the edit directory.
+        definition(:obj:`hou.HDADefinition`,optional): The node's definition, if the
+            caller has already looked it up.
 
     Returns:
         (bool): Is the definition editable.
     """
-    if nodes.definition_from_node(current_node.path()):
-        manager = get_hda_manager()
+    if definition is None:
         definition = nodes.definition_from_node(current_node.path())
-        if definition.libraryFilePath().startswith(manager.edit_dir):
-            return True
-    return False
+    return bool(definition and definition.libraryFilePath().startswith(edit_dir()))
 
 
 def display_main_menu(current_node):
@@ -61,11 +77,14 @@ def display_make_editable(current_node):
     Returns:
         (bool): Display the menu?
     """
-    return (
-        nodes.is_digital_asset(current_node.path())
-        and not utilities.using_embedded_definition(current_node)
-        and not in_edit_directory(current_node)
-    )
+    if not nodes.is_digital_asset(current_node.path()):
+        return False
+
+    # Look up the definition once for both checks
+    definition = nodes.definition_from_node(current_node.path())
+    return not utilities.using_embedded_definition(
+        current_node, definition=definition
+    ) and not in_edit_directory(current_node, definition=definition)
 
 
 def display_discard_editable(current_node):
@@ -4,13 +4,14 @@
 
 import logging
 
-from packaging.version import parse
-
 from rbl_pipe_hdamanager import nodetypeversion
 from rbl_pipe_hdamanager import utilities
 
 logger = logging.getLogger(__name__)
 
+# Shared result for versions that don't exist, to avoid creating a new list each time
+_EMPTY = ()
+
 
 class NodeType(object):
     """NodeType - Details about Houdini NodeTypes.
@@ -18,6 +19,16 @@ class NodeType(object):
     This includes a record of all available versions along with those currently loaded.
     """
 
+    __slots__ = (
+        "manager",
+        "name",
+        "namespace",
+        "versions",
+        "version_paths",
+        "_parsed_versions",
+        "_max_version",
+    )
+
     def __init__(
         self,
         manager,
@@ -36,11 +47,10 @@ class NodeType(object):
         self.name = name
         self.namespace = namespace
         self.versions = dict()
-        logger.info(
-            "Initialised NodeType: {namespace}::{name}".format(
-                namespace=self.namespace, name=self.name
-            )
-        )
+        self.version_paths = dict()
+        self._parsed_versions = dict()
+        self._max_version = None
+        logger.info("Initialised NodeType: %s::%s", self.namespace, self.name)
 
     def add_version(self, version, definition, force=False):
         """
@@ -52,11 +62,7 @@ class NodeType(object):
             force(:obj:`bool`,optional): Force the version to be added irrespective of
                 the load depth.
         """
-        logger.info(
-            "Adding version {version} for {namespace}::{name}".format(
-                version=version, namespace=self.namespace, name=self.name
-            )
-        )
+        logger.info("Adding version %s for %s::%s", version, self.namespace, self.name)
         install = False
         path = definition.libraryFilePath()
         if force or self.num_versions() < self.manager.depth:
@@ -69,10 +75,34 @@ class NodeType(object):
         if version is None:
             version = "no version"
 
-        if self.versions.get(version):
-            self.versions[version].append(node_type_version)
+        # Replace any NodeTypeVersion already added from the same file, otherwise
+        # add it to the versions.
+        existing = self.version_paths.get((version, path))
+        if existing is not None:
+            version_definitions = self.versions[version]
+            version_definitions[version_definitions.index(existing)] = node_type_version
+            # The file is still installed in Houdini if the previous version was
+            if existing.installed:
+                node_type_version.installed = True
         else:
-            self.versions[version] = [node_type_version]
+            self.versions.setdefault(version, []).append(node_type_version)
+        self.version_paths[(version, path)] = node_type_version
+
+        # Parse each version once, rather than every time they are compared.
+        # "no version" isn't a valid version so is stored as None.
+        if version not in self._parsed_versions:
+            self._parsed_versions[version] = (
+                utilities.parse_version(version) if version != "no version" else None
+            )
+        parsed_version = self._parsed_versions[version]
+
+        # Keep any cached max version up to date rather than recomputing it
+        if (
+            parsed_version is not None
+            and self._max_version is not None
+            and parsed_version > self._max_version
+        ):
+            self._max_version = parsed_version
 
     def remove_version(self, definition):
         """
@@ -90,26 +120,18 @@ class NodeType(object):
         if not version:
             version = "no version"
 
-        # Get a list of nodetype definitions for the given version
-        version_definitions = self.get_version(version)
-        index = 0
-        for node_type_version in version_definitions:
-            if path == node_type_version.path:
-                self.remove_version_at_index(version, index)
-
-                # Uninstall the .hda file
-                utilities.uninstall_definition(
-                    definition, backup_dir=self.manager.backup_dir()
-                )
-                logger.debug(
-                    "Removed Version {version} from {nodetype}".format(
-                        version=version, nodetype=self.name
-                    )
-                )
-                return
-            index += 1
-
-        raise RuntimeError("Couldn't remove version for {path}".format(path=path))
+        # Look up the NodeTypeVersion for the given version and path
+        node_type_version = self.version_paths.get((version, path))
+        if node_type_version is None:
+            raise RuntimeError("Couldn't remove version for {path}".format(path=path))
+
+        index = self.get_version(version).index(node_type_version)
+        self.remove_version_at_index(version, index)
+
+        # Uninstall the .hda file
+        utilities.uninstall_definition(definition, backup_dir=self.manager.backup_dir())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Removed Version %s from %s", version, self.name)
 
     def remove_version_at_index(self, version, index):
         """
@@ -122,14 +144,19 @@ class NodeType(object):
         Raises:
             RuntimeError: Invalid version or index provided.
         """
-        if not self.get_version(version):
+        version_definitions = self.get_version(version)
+        if not version_definitions:
             raise RuntimeError("Version not found: {version}".format(version=version))
 
-        if not index < len(self.get_version(version)):
+        if not index < len(version_definitions):
             raise RuntimeError("Invalid index: {index}".format(index=index))
 
         # Remove the NodeTypeVersion
-        del self.get_version(version)[index]
+        node_type_version = version_definitions.pop(index)
+        self.version_paths.pop((version, node_type_version.path), None)
+
+        # The available versions have changed
+        self._max_version = None
 
     def get_version(self, version):
         """
@@ -139,17 +166,15 @@ class NodeType(object):
             version(str): The version to get the NodeTypeVersions for.
 
         Returns:
-            (list): A list of NodeTypeVersions for the given version.
+            (list): A list of NodeTypeVersions for the given version, empty if the
+                version doesn't exist.
         """
-        if version in self.versions:
-            return self.versions.get(version)
+        version_definitions = self.versions.get(version)
+        if version_definitions is not None:
+            return version_definitions
 
-        logger.debug(
-            "Version {version} for {name} doesn't exist.".format(
-                version=version, name=self.name
-            )
-        )
-        return list()
+        logger.debug("Version %s for %s doesn't exist.", version, self.name)
+        return _EMPTY
 
     def num_versions(self):
         """
@@ -173,16 +198,24 @@ class NodeType(object):
         """
         Get the highest version of the node type.
 
+        The result is cached, updated as versions are added and reset when they are
+        removed. "no version" entries are ignored.
+
         Returns:
-            (str): The highest version.
+            (packaging.version.Version): The highest version, or None if there are no
+                versioned entries.
         """
-        versions = [parse(version) for version in self.all_versions().keys()]
-        versions.sort(reverse=True)
-
-        if versions:
-            return versions[0]
+        if self._max_version is None:
+            self._max_version = max(
+                (
+                    parsed_version
+                    for parsed_version in self._parsed_versions.values()
+                    if parsed_version is not None
+                ),
+                default=None,
+            )
 
-        return None
+        return self._max_version
 
     def loaded_versions(self, current=False):
         """
@@ -196,8 +229,7 @@ class NodeType(object):
             (dict): A dictionary of node versions which are currently loaded.
         """
         result = {}
-        for version in self.versions:
-            version_list = self.versions.get(version)
+        for version, version_list in self.versions.items():
             loaded = []
             for node_type_version in version_list:
                 if not node_type_version.definition.isInstalled():
@@ -219,8 +251,7 @@ class NodeType(object):
             (dict): A dictionary of node versions which aren't currently loaded.
         """
         result = {}
-        for version in self.versions:
-            version_list = self.versions.get(version)
+        for version, version_list in self.versions.items():
             unloaded = [
                 node_type_version
                 for node_type_version in version_list
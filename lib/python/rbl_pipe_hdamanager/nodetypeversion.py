@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 class NodeTypeVersion(object):
     """NodeTypeVersion - Details about a specific version of a Houdini NodeType."""
 
+    __slots__ = ("path", "definition", "installed")
+
     def __init__(
         self,
         path,
@@ -29,7 +31,8 @@ class NodeTypeVersion(object):
                 version.
             install(:obj:`bool`,optional): Should this version be installed.
         """
-        logger.debug("Initialised NodeTypeVersion: {version}".format(version=self))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Initialised NodeTypeVersion: %s", self)
         self.path = path
         self.definition = definition
         self.installed = False
@@ -46,7 +49,7 @@ class NodeTypeVersion(object):
         )
 
         self.installed = True
-        logger.info("Installed file {path}".format(path=path))
+        logger.info("Installed file %s", path)
 
         utilities.cleanup_embedded_definitions(self.definition.nodeType())
 
@@ -54,5 +57,5 @@ class NodeTypeVersion(object):
         """Hide this node type definition."""
         if self.definition.isInstalled():
             node_type = self.definition.nodeType()
-            logger.info("Hiding {node_type}".format(node_type=node_type))
+            logger.info("Hiding %s", node_type)
             node_type.setHidden(True)
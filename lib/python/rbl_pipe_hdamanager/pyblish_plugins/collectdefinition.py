@@ -22,4 +22,4 @@ class CollectDefinition(pyblish.api.ContextPlugin):
         publish_node = manager.HDAManager.publish_node
         name = publish_node.type().name()
         instance = context.create_instance(name)
-        instance[:] = [manager.HDAManager.publish_node]
+        instance[:] = [publish_node]
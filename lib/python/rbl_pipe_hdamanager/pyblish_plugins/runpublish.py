@@ -21,6 +21,7 @@ class RunPublish(pyblish.api.InstancePlugin):
                 validating.
         """
         man = manager.HDAManager.init()
+        stop_validator = manager.HDAManager.validator_ui.stop
         for node in instance:
             man.publish_definition(node)
-            manager.HDAManager.validator_ui.stop()
+            stop_validator()
@@ -23,11 +23,17 @@ class ValidateIsLatestVersion(pyblish.api.InstancePlugin):
         Raises:
             RuntimeError: Node unlocked or has unsaved changes.
         """
+        m = manager.HDAManager.instance
+
+        # Nodes of the same type share a definition, so only check each type once
+        latest = {}
         for node in instance:
-            m = manager.HDAManager.instance
-            if not m.is_latest_version(node):
+            node_type_name = node.type().name()
+            if node_type_name not in latest:
+                latest[node_type_name] = m.is_latest_version(node)
+            if not latest[node_type_name]:
                 raise RuntimeError(
                     "{node} is not the latest version. Make sure to match the latest "
                     "version or have a higher version then the lastest version before "
-                    "publishing.".format(node=node.type().name())
+                    "publishing.".format(node=node_type_name)
                 )
@@ -23,12 +23,17 @@ class ValidateNamespace(pyblish.api.InstancePlugin):
         Raises:
             RuntimeError: Invalid namespace found.
         """
+        man = manager.HDAManager.init()
+
+        # Nodes of the same type share a definition, so only check each type once
+        valid = {}
         for node in instance:
-            definition = node.type().definition()
-            man = manager.HDAManager.init()
-            if not man.valid_namespace(definition):
+            node_type_name = node.type().name()
+            if node_type_name not in valid:
+                valid[node_type_name] = man.valid_namespace(node.type().definition())
+            if not valid[node_type_name]:
                 raise RuntimeError(
                     "Invalid namespace for {node}".format(
-                        node=node.type().name(),
+                        node=node_type_name,
                     )
                 )
@@ -7,7 +7,8 @@ import os
 import re
 import shutil
 import subprocess
-from tempfile import mkstemp
+import time
+from functools import cached_property
 
 from git import Repo
 
@@ -19,6 +20,12 @@ from rbl_pipe_hdamanager.utilities import get_config
 
 logger = logging.getLogger(__name__)
 
+_VERSION_LINE_RE = re.compile("^version.*$", re.M)
+_VERSION_RE = re.compile('"([^"]*)"')
+# How many times, and how many seconds apart, to look for the released HDA
+_RELEASE_CHECK_ATTEMPTS = 5
+_RELEASE_CHECK_DELAY = 1.0
+
 
 class HDARelease(object):
     """The HDA Release process.
@@ -63,6 +70,7 @@ class HDARelease(object):
         self.comment = release_comment
         logger.info("Initialised HDA Release process")
 
+    @cached_property
     def git_dir(self):
         """
         Get the path to the git repository.
@@ -72,6 +80,7 @@ class HDARelease(object):
         """
         return os.path.join(self.release_dir, "git")
 
+    @cached_property
     def expand_dir(self):
         """
         Get the path where the HDA will be expanded.
@@ -81,6 +90,7 @@ class HDARelease(object):
         """
         return os.path.join(self.release_dir, self.hda_name)
 
+    @cached_property
     def package_root(self):
         """
         Get the path to the root of the package.
@@ -88,8 +98,9 @@ class HDARelease(object):
         Returns:
             (str): The package root.
         """
-        return os.path.join(self.git_dir(), self.package)
+        return os.path.join(self.git_dir, self.package)
 
+    @cached_property
     def package_py_path(self):
         """
         Get the path to the package to be released.
@@ -97,8 +108,9 @@ class HDARelease(object):
         Returns:
             (str): The package.py path.
         """
-        return os.path.join(self.package_root(), "package.py")
+        return os.path.join(self.package_root, "package.py")
 
+    @cached_property
     def hda_path(self):
         """
         Get the path to the HDA to be released.
@@ -106,7 +118,7 @@ class HDARelease(object):
         Returns:
             (str): The HDA path.
         """
-        return os.path.join(self.package_root(), "hda", self.hda_name)
+        return os.path.join(self.package_root, "hda", self.hda_name)
 
     def release_hda_path(self):
         """
@@ -137,23 +149,20 @@ class HDARelease(object):
         """
         # Clone the repo
         repo = Repo(self.hda_repo)
-        cloned_repo = repo.clone(self.git_dir())
+        cloned_repo = repo.clone(self.git_dir)
+        git = cloned_repo.git
 
         current = cloned_repo.create_head(self.release_branch)
         current.checkout()
 
         # Check if expanded HDA directory already exists, delete it if it does
-        hda_path = self.hda_path()
+        hda_path = self.hda_path
         if os.path.exists(hda_path):
             shutil.rmtree(hda_path)
-            logger.debug(
-                "Removed directory already exists, removing: {path}".format(
-                    path=hda_path
-                )
-            )
+            logger.debug("Removed directory already exists, removing: %s", hda_path)
 
         # Copy the expanaded HDA into it's correct location
-        shutil.copytree(self.expand_dir(), hda_path)
+        shutil.copytree(self.expand_dir, hda_path)
 
         # See if anything was updated
         changes = [change.a_path for change in cloned_repo.index.diff(None)]
@@ -162,100 +171,93 @@ class HDARelease(object):
             return None
 
         # Add and commit
-        cloned_repo.git.add(A=True)
-        cloned_repo.git.commit(m=self.comment)
-        cloned_repo.git.push("--set-upstream", "origin", current)
+        git.add(A=True)
+        git.commit(m=self.comment)
+        git.push("--set-upstream", "origin", current)
 
         # Up the package version
-        fh, abs_path = mkstemp()
-        with os.fdopen(fh, "w") as new_file:
-            with open(self.package_py_path()) as old_file:
-                for line in old_file:
-                    if line.startswith("version"):
-                        versions = re.findall('"([^"]*)"', line)
-                        if len(versions) != 1:
-                            raise RuntimeError(
-                                "Invalid package.py. Found {num} version strings. "
-                                "Should only be one.".format(num=len(versions))
-                            )
-
-                        version = parse(versions[0])
-                        self.release_version = "{major}.{minor}.{patch}".format(
-                            major=version.major, minor=version.minor + 1, patch=0
-                        )
-                        updated_line = 'version = "{version}"\n'.format(
-                            version=self.release_version
-                        )
-                        new_file.write(updated_line)
-                    else:
-                        new_file.write(line)
-
-        shutil.copymode(self.package_py_path(), abs_path)
-        os.remove(self.package_py_path())
-        shutil.move(abs_path, self.package_py_path())
+        def version_up(match):
+            versions = _VERSION_RE.findall(match.group(0))
+            if len(versions) != 1:
+                raise RuntimeError(
+                    "Invalid package.py. Found {num} version strings. "
+                    "Should only be one.".format(num=len(versions))
+                )
+
+            version = parse(versions[0])
+            self.release_version = "{major}.{minor}.{patch}".format(
+                major=version.major, minor=version.minor + 1, patch=0
+            )
+            return 'version = "{version}"'.format(version=self.release_version)
+
+        with open(self.package_py_path) as package_file:
+            package_text = package_file.read()
+
+        package_text, count = _VERSION_LINE_RE.subn(version_up, package_text, count=1)
+        if not count:
+            raise RuntimeError("Invalid package.py. No version string found.")
+
+        with open(self.package_py_path, "w") as package_file:
+            package_file.write(package_text)
 
         # Commit and push
-        cloned_repo.git.commit(self.package_py_path(), m="Version up")
-        cloned_repo.git.push()
+        git.commit(self.package_py_path, m="Version up")
+        git.push()
 
         # rez-release
         subprocess_env = rezclean.get_base_env()
         # In case we're operating in a custom Rez environment:
         subprocess_env["REZ_CONFIG_FILE"] = os.getenv("REZ_CONFIG_FILE")
-        process = subprocess.Popen(
-            "rez-release",
-            cwd=self.package_root(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        process = subprocess.run(
+            ["rez-release"],
+            cwd=self.package_root,
+            capture_output=True,
             env=subprocess_env,
         )
-        process.wait()
 
         # verify release
         if process.returncode != 0:
             # Non-zero return code
-            try:
-                _stdout = process.stdout.read()
-                _stderr = process.stderr.read()
-            except Exception as e:
-                _stdout = ""
-                _stderr = str(e)
             raise RuntimeError(
                 "rez-release didn't complete successfully: {} :: {} :: {}".format(
-                    process.returncode, _stdout, _stderr
+                    process.returncode, process.stdout, process.stderr
                 )
             )
 
         release_path = self.release_hda_path()
-        # Using open instead of os.path.exists as we seemed to be getting false
-        # negatives with that approach - caching issue perhaps.
-        try:
-            with os.path.open(release_path, "r") as fh:
-                pass
-            exists = True
-        except Exception:
-            exists = False
-        if exists:
+        # os.stat and os.path.exists can give false negatives from the client-side
+        # attribute cache on network storage. Listing the parent directory forces
+        # the directory to be revalidated, retrying briefly in case it lags.
+        release_parent, release_name = os.path.split(release_path)
+        exists = False
+        for attempt in range(_RELEASE_CHECK_ATTEMPTS):
+            if attempt:
+                time.sleep(_RELEASE_CHECK_DELAY)
+            try:
+                exists = release_name in os.listdir(release_parent)
+            except FileNotFoundError:
+                exists = False
+            if exists:
+                break
+        if not exists:
             raise RuntimeError(
                 "Error when verifying the release, expected to find released hda at: "
                 "{path}".format(path=release_path)
             )
 
         # merge to master
-        cloned_repo.git.reset("--hard")
+        git.reset("--hard")
         master = cloned_repo.heads.master
         master.checkout()
-        cloned_repo.git.pull()
-        cloned_repo.git.merge(current, "--no-ff")
-        cloned_repo.git.push()
+        git.pull()
+        git.merge(current, "--no-ff")
+        git.push()
 
         # clean up release dir
         shutil.rmtree(self.release_dir)
-        logger.debug(
-            "Cleaned up release directory {path}".format(path=self.release_dir)
-        )
+        logger.debug("Cleaned up release directory %s", self.release_dir)
 
         # success
-        logger.info("Release successful for {hda}.".format(hda=self.hda_name))
+        logger.info("Release successful for %s.", self.hda_name)
 
         return self.release_hda_path()
@@ -6,11 +6,17 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import hou
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from packaging.version import InvalidVersion
 from packaging.version import Version
-from packaging.version import parse
 
 from rbl_pipe_core.util import filesystem
 
@@ -22,12 +28,27 @@ from rbl_pipe_houdini.utils import nodes
 
 logger = logging.getLogger(__name__)
 
+# regex used to read package.py details
+_NAME_RE = re.compile(rb"\nname\s*=\s*[\"'](.+)[\"']")
+_VERSION_RE = re.compile(rb"\nversion\s*=\s*[\"'](.+)[\"']")
+_REVISION_RE = re.compile(rb"\nrevision =.*\n *{(.|\n)*?}")
+_COMMIT_RE = re.compile(rb"\s*'commit': '(.*)',")
+
+# Parsed package.py details, keyed by (path, mtime) so edits are picked up
+_PACKAGE_DETAILS_CACHE = dict()
+
+# Parsed ophide lists, keyed by (path, mtime) so edits are picked up
+_OPHIDE_LIST_CACHE = dict()
+
 
 class HDARepo(object):
     """HDA Repository - associated with a rez package that contains Houdini HDAs."""
 
     __config = utilities.get_config()
     packages_root = __config.get("packages_root")
+    # Number of threads used to read .hda files, Houdini threading support varies so
+    # this is disabled by default.
+    load_threads = __config.get("load_threads")
 
     def __init__(
         self,
@@ -47,7 +68,8 @@ class HDARepo(object):
         self.repo_path = repo_path
         self.asset_subdirectory = "hda"
         self.node_types = dict()
-        self.extensions = [".hda"]
+        self.extensions = frozenset({".hda"})
+        self.loaded_asset_dirs = set()
         self.package_name = None
         self.package_version = None
         self.commit_hash = None
@@ -114,10 +136,9 @@ class HDARepo(object):
         """
         current_name = definition.nodeTypeName()
         category = definition.nodeTypeCategory().name()
-        index = utilities.node_type_index(current_name, category)
-        name = utilities.node_type_name(current_name)
-        namespace = utilities.node_type_namespace(current_name)
-        version = utilities.node_type_version(current_name)
+        index, name, namespace, version = utilities.parse_node_type_components(
+            current_name, category
+        )
 
         # Add the node_type to our dictionary if it doesn't already exist
         if index not in self.node_types:
@@ -147,9 +168,9 @@ class HDARepo(object):
 
         # Skip any versions higher than the maximum (first) loaded version
         if version and not current_version:
-            this_version = parse(version)
+            this_version = utilities.parse_version(version)
             max_version = self.node_types.get(index).max_version()
-            if this_version > max_version:
+            if max_version is not None and this_version > max_version:
                 logger.debug(
                     "{index}: skipping version {ver} (Current version: {max})".format(
                         index=index,
@@ -194,6 +215,18 @@ class HDARepo(object):
         """
         logger.debug("Reading from asset_dir {directory}".format(directory=asset_dir))
 
+        # Skip directories already read during this load, ie. when the repo root and
+        # the main packages root resolve to the same location.
+        real_asset_dir = os.path.realpath(asset_dir)
+        if real_asset_dir in self.loaded_asset_dirs:
+            logger.debug(
+                "Skipping asset_dir {directory} as already loaded".format(
+                    directory=asset_dir
+                )
+            )
+            return
+        self.loaded_asset_dirs.add(real_asset_dir)
+
         if not os.path.exists(asset_dir):
             if self.editable:
                 logger.info(
@@ -205,10 +238,23 @@ class HDARepo(object):
                     "Couldn't load asset_dir: {directory}".format(directory=asset_dir)
                 )
 
-        for hda_file in os.listdir(asset_dir):
-            if os.path.splitext(hda_file)[1].lower() in self.extensions:
-                full_path = os.path.join(asset_dir, hda_file)
-                self.process_hda_file(full_path, current_version=current_version)
+        with os.scandir(asset_dir) as entries:
+            hda_paths = [
+                entry.path
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in self.extensions
+            ]
+
+        if not self.load_threads or len(hda_paths) < 2:
+            for hda_path in hda_paths:
+                self.process_hda_file(hda_path, current_version=current_version)
+            return
+
+        # Read the .hda files in parallel, but process the definitions on this thread
+        with ThreadPoolExecutor(max_workers=self.load_threads) as executor:
+            for definitions in executor.map(hou.hda.definitionsInFile, hda_paths):
+                for definition in definitions:
+                    self.process_definition(definition, current_version=current_version)
 
     def process_ophide_list(self, ophide_list_path):
         """Process an ophide list at the given path.
@@ -222,9 +268,17 @@ class HDARepo(object):
         Returns:
             (None)
         """
-        ophide_list_data = None
-        with open(ophide_list_path, "r") as ophide_list:
-            ophide_list_data = json.load(ophide_list)
+        key = (ophide_list_path, os.stat(ophide_list_path).st_mtime_ns)
+        ophide_list_data = _OPHIDE_LIST_CACHE.get(key)
+        if ophide_list_data is None:
+            # Use orjson when it is available as it parses faster
+            if orjson:
+                with open(ophide_list_path, "rb") as ophide_list:
+                    ophide_list_data = orjson.loads(ophide_list.read())
+            else:
+                with open(ophide_list_path, "r") as ophide_list:
+                    ophide_list_data = json.load(ophide_list)
+            _OPHIDE_LIST_CACHE[key] = ophide_list_data
 
         if not ophide_list_data:
             logger.warning(
@@ -256,6 +310,7 @@ class HDARepo(object):
 
     def load(self):
         """Load all definitions contained by this repository."""
+        self.loaded_asset_dirs.clear()
         if self.editable:
             self.process_package_directory(self.repo_path)
         else:
@@ -284,32 +339,35 @@ class HDARepo(object):
             same_major_version(:obj:`bool`,optional): Should the loading of previous
                 versions be limited to the current major version.
         """
-        current_version = parse(self.package_version)
-
-        package_versions = [parse(ver) for ver in os.listdir(repo_root)]
-
-        package_versions = [
-            ver
-            for ver in package_versions
-            if isinstance(ver, Version) and ver <= current_version
-        ]
-
-        if same_major_version:
-            package_versions = [
-                ver for ver in package_versions if ver.major == current_version.major
-            ]
+        current_version = utilities.parse_version(self.package_version)
+
+        # Filter the version directories in a single pass
+        package_versions = []
+        with os.scandir(repo_root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                try:
+                    version = Version(entry.name)
+                except InvalidVersion:
+                    continue
+                if version > current_version:
+                    continue
+                if same_major_version and version.major != current_version.major:
+                    continue
+                package_versions.append((version, entry.path))
 
         package_versions.sort(reverse=True)
-        for version in package_versions:
+        for version, version_path in package_versions:
             current = False
             if version == current_version:
                 current = True
 
-            asset_dir = os.path.join(repo_root, str(version), self.asset_subdirectory)
+            asset_dir = os.path.join(version_path, self.asset_subdirectory)
             self.process_package_directory(asset_dir, current_version=current)
 
             if current:
-                ophide_list_path = os.path.join(repo_root, str(version), "ophide.json")
+                ophide_list_path = os.path.join(version_path, "ophide.json")
                 if os.path.isfile(ophide_list_path):
                     self.process_ophide_list(ophide_list_path)
 
@@ -320,18 +378,13 @@ class HDARepo(object):
             (None)
         """
         package_path = os.path.join(self.repo_path, "package.py")
-        with open(package_path, "r") as file:
-            package_contents = file.read()
+        key = (package_path, os.stat(package_path).st_mtime_ns)
+        details = _PACKAGE_DETAILS_CACHE.get(key)
+        if details is None:
+            details = self.read_package_details(package_path)
+            _PACKAGE_DETAILS_CACHE[key] = details
 
-        name_regex = re.compile(r"\nname\s*=\s*[\"'](.+)[\"']")
-        name_match = name_regex.search(package_contents)
-        if name_match:
-            self.package_name = name_match.group(1)
-
-        version_regex = re.compile(r"\nversion\s*=\s*[\"'](.+)[\"']")
-        version_match = version_regex.search(package_contents)
-        if version_match:
-            self.package_version = version_match.group(1)
+        self.package_name, self.package_version, self.commit_hash = details
 
         logger.debug(
             "Loaded rez package details for {name}-{version}".format(
@@ -339,20 +392,13 @@ class HDARepo(object):
             )
         )
 
-        # try and load the commit hash for this release
-        revision = re.compile(r"\nrevision =.*\n *{(.|\n)*?}")
-        commit = re.compile(r"\s*'commit': '(.*)',")
-        revision_match = revision.search(package_contents)
-        if revision_match:
-            commit_match = commit.search(revision_match.group(0))
-            if commit_match:
-                self.commit_hash = commit_match.group(1)
-                logger.info(
-                    "Release commit found for {name}.".format(
-                        name=self.package_name,
-                    )
+        if self.commit_hash is not None:
+            logger.info(
+                "Release commit found for {name}.".format(
+                    name=self.package_name,
                 )
-                return
+            )
+            return
 
         logger.warning(
             "Release commit not found for {name}.".format(
@@ -360,6 +406,41 @@ class HDARepo(object):
             )
         )
 
+    @staticmethod
+    def read_package_details(package_path):
+        """Parse the rez package name, version and release commit from a package.py.
+
+        Args:
+            package_path(str): The path to the package.py file to read.
+
+        Returns:
+            (tuple): The package name, version and commit hash. Any that couldn't be
+                found are None.
+        """
+        # Match against the raw bytes and only decode what is captured
+        with open(package_path, "rb") as file:
+            package_contents = file.read()
+
+        package_name = None
+        name_match = _NAME_RE.search(package_contents)
+        if name_match:
+            package_name = name_match.group(1).decode("utf-8")
+
+        package_version = None
+        version_match = _VERSION_RE.search(package_contents)
+        if version_match:
+            package_version = version_match.group(1).decode("utf-8")
+
+        # try and load the commit hash for this release
+        commit_hash = None
+        revision_match = _REVISION_RE.search(package_contents)
+        if revision_match:
+            commit_match = _COMMIT_RE.search(revision_match.group(0))
+            if commit_match:
+                commit_hash = commit_match.group(1).decode("utf-8")
+
+        return package_name, package_version, commit_hash
+
     def namespace_from_package(self):
         """Define the available namespaces as infered from the package name.
 
@@ -14,12 +14,17 @@ from PySide2.QtWidgets import (
     QWidget,
 )
 
-from packaging.version import parse
-
 from rbl_pipe_hdamanager import utilities
 
 from rbl_pipe_houdini.utils import nodes
 
+# Marks versions not yet looked up, as None is a valid current version
+_MISSING = object()
+
+# Version menu labels, in the same order as ConfigureWindow.version_options
+_VERSION_LABELS = ("No change", "Increment Major", "Increment Minor", "Increment Patch")
+_INITIAL_VERSION_LABELS = ("Initial Version",)
+
 
 class ConfigureWindow(QWidget):
     """Qt Window for the Configure UI."""
@@ -37,6 +42,9 @@ class ConfigureWindow(QWidget):
         self.manager = manager
         self.current_node = current_node
         self.definition = nodes.definition_from_node(current_node.path())
+        self.all_namespaces = self.manager.all_available_namespaces()
+        self.current_versions = dict()
+        self.version_options = list()
         self.setLayout(QVBoxLayout())
         self.setup_window()
         self.setup_contents()
@@ -87,7 +95,7 @@ class ConfigureWindow(QWidget):
         label.setFixedWidth(150)
         namespace_layout.addWidget(label)
         self.namespace = QComboBox()
-        self.namespace.addItems(self.manager.all_available_namespaces())
+        self.namespace.addItems(self.all_namespaces)
         index = self.namespace.findText(
             utilities.node_type_namespace(current_name), QtCore.Qt.MatchFixedString
         )
@@ -111,6 +119,9 @@ class ConfigureWindow(QWidget):
         label.setFixedWidth(150)
         version_layout.addWidget(label)
         self.version = QComboBox()
+        # Reuse one model, rather than recreating the items each time the menu changes
+        self.version_model = QtCore.QStringListModel(self.version)
+        self.version.setModel(self.version_model)
         version_layout.addWidget(self.version)
         self.layout().addLayout(version_layout)
 
@@ -124,13 +135,40 @@ class ConfigureWindow(QWidget):
 
         self.update_version_menu()
 
+        # Only update once typing in the name field pauses
+        self.name_timer = QtCore.QTimer(self)
+        self.name_timer.setSingleShot(True)
+        self.name_timer.setInterval(120)
+
         #  Callbacks
         self.namespace.currentIndexChanged.connect(self.update_version_menu)
-        self.name.textEdited.connect(self.update_version_menu)
+        self.name.textEdited.connect(lambda text: self.name_timer.start())
+        self.name_timer.timeout.connect(self.update_version_menu)
         self.version.currentIndexChanged.connect(self.update_node_type_name)
         self.update_button.clicked.connect(self.update)
         self.cancel_button.clicked.connect(self.close)
 
+    def current_node_type_version(self, category, namespace, name):
+        """Get the current version for the given node type.
+
+        The callbacks run on every edit, so versions are only looked up from the
+        manager once per node type.
+
+        Args:
+            category(str): The node type category.
+            namespace(str): The node type namespace.
+            name(str): The node type name.
+
+        Returns:
+            (str): The current version of the node type.
+        """
+        key = (category, namespace, name)
+        version = self.current_versions.get(key, _MISSING)
+        if version is _MISSING:
+            version = self.manager.current_node_type_version(category, namespace, name)
+            self.current_versions[key] = version
+        return version
+
     def update_version_menu(self):
         """Update the version menu.
 
@@ -139,30 +177,34 @@ class ConfigureWindow(QWidget):
         namespace = self.namespace.currentText()
         name = self.name.text()
         category = self.definition.nodeTypeCategory().name()
-        menu = list()
-        current_version = self.manager.current_node_type_version(
-            category, namespace, name
-        )
+        current_version = self.current_node_type_version(category, namespace, name)
         if current_version:
-            version = parse(current_version)
-            major_increment = "{major}.{minor}.{patch}".format(
-                major=version.major + 1, minor=0, patch=0
-            )
-            minor_increment = "{major}.{minor}.{patch}".format(
-                major=version.major, minor=version.minor + 1, patch=0
-            )
-            patch_increment = "{major}.{minor}.{patch}".format(
-                major=version.major, minor=version.minor, patch=version.micro + 1
-            )
-            menu.append("No change ({version})".format(version=current_version))
-            menu.append("Increment Major ({version})".format(version=major_increment))
-            menu.append("Increment Minor ({version})".format(version=minor_increment))
-            menu.append("Increment Patch ({version})".format(version=patch_increment))
+            version = utilities.parse_version(current_version)
+            major, minor, patch = version.major, version.minor, version.micro
+            self.version_options = [
+                current_version,
+                "{major}.0.0".format(major=major + 1),
+                "{major}.{minor}.0".format(major=major, minor=minor + 1),
+                "{major}.{minor}.{patch}".format(
+                    major=major, minor=minor, patch=patch + 1
+                ),
+            ]
+            labels = _VERSION_LABELS
         else:
-            menu.append("Initial Version (1.0.0)")
+            self.version_options = ["1.0.0"]
+            labels = _INITIAL_VERSION_LABELS
 
-        self.version.clear()
-        self.version.addItems(menu)
+        menu = [
+            "{label} ({version})".format(label=label, version=version)
+            for label, version in zip(labels, self.version_options)
+        ]
+
+        # Only rebuild the menu if it has changed, without firing the index callbacks
+        if menu != self.version_model.stringList():
+            self.version.blockSignals(True)
+            self.version_model.setStringList(menu)
+            self.version.setCurrentIndex(0)
+            self.version.blockSignals(False)
 
         self.update_node_type_name()
 
@@ -173,31 +215,13 @@ class ConfigureWindow(QWidget):
         """
         namespace = self.namespace.currentText()
         name = self.name.text()
-        category = self.definition.nodeTypeCategory().name()
 
-        version_selection = self.version.currentText()
-        version = self.manager.current_node_type_version(category, namespace, name)
-        if not version:
-            updated_version = "1.0.0"
-        elif version_selection.startswith("Increment Major"):
-            parsed_version = parse(version)
-            updated_version = "{major}.{minor}.{patch}".format(
-                major=parsed_version.major + 1, minor=0, patch=0
-            )
-        elif version_selection.startswith("Increment Minor"):
-            parsed_version = parse(version)
-            updated_version = "{major}.{minor}.{patch}".format(
-                major=parsed_version.major, minor=parsed_version.minor + 1, patch=0
-            )
-        elif version_selection.startswith("Increment Patch"):
-            parsed_version = parse(version)
-            updated_version = "{major}.{minor}.{patch}".format(
-                major=parsed_version.major,
-                minor=parsed_version.minor,
-                patch=parsed_version.micro + 1,
-            )
+        # The version menu is rebuilt alongside the options, so share its index
+        index = self.version.currentIndex()
+        if 0 <= index < len(self.version_options):
+            updated_version = self.version_options[index]
         else:
-            updated_version = version
+            updated_version = self.version_options[0]
 
         updated_name = "{namespace}::{name}::{version}".format(
             namespace=namespace, name=name, version=updated_version
@@ -218,8 +242,15 @@ class ConfigureWindow(QWidget):
 
         This callback is run when the update button is clicked.
         """
+        # Pick up any name edit still waiting on the timer
+        if self.name_timer.isActive():
+            self.name_timer.stop()
+            self.update_version_menu()
+
         repo = self.manager.repo_from_definition(self.definition)
         repo.update_node_type_name(
             self.current_node, node_type_name=self.updated_name.text()
         )
+        # The available versions have changed
+        self.current_versions.clear()
         self.close()
@@ -2,31 +2,66 @@
 
 """HDA manager utils."""
 
+import functools
 import logging
 import os
 import shutil
+import sys
 import time
 
 import hou
 
+from packaging.version import parse
+
 from rbl_pipe_core.util import config
 
 from rbl_pipe_houdini.utils import nodes
 
 logger = logging.getLogger(__name__)
 
+# Root of the installed package, used to locate the config
+_BASEDIR = os.path.abspath(__file__).rsplit("/lib/python", 1)[0]
+
+# libraryFilePath() of definitions embedded in the hip file
+_EMBEDDED = "Embedded"
+
+# Timestamp format used in release branch names
+_RELEASE_TIME_FORMAT = "%d-%m-%y-%H-%M-%S"
+
+# Publish flags read from the environment, see refresh_publish_flags()
+_ALLOW_PUBLISH = True
+_ALLOW_SHOW_PUBLISH = False
+
 
+@functools.lru_cache(maxsize=1)
 def get_config():
     """Load config file for this repository.
 
+    The config doesn't change during a session, so it is only loaded once.
+
     Returns:
         (rbl_pipe_core.util.config.Config): The config object for the repository.
     """
-    basedir = os.path.abspath(__file__).rsplit("/lib/python", 1)[0]
-    config_file = os.path.join(basedir, "config", "rbl_pipe_hdamanager.json")
+    config_file = os.path.join(_BASEDIR, "config", "rbl_pipe_hdamanager.json")
     return config.ConfigRepo.get(config_file)
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_version(version):
+    """Parse a version string.
+
+    The same version strings are parsed repeatedly while loading repos and updating the
+    UI, so results are cached. Version objects are immutable so are safe to share.
+
+    Args:
+        version(str): The version string to parse.
+
+    Returns:
+        (packaging.version.Version): The parsed version.
+    """
+    return parse(version)
+
+
 def embedded_definition(definition):
     """
     Determine if the given hou.HDADefinition is embedded.
@@ -37,25 +72,25 @@ def embedded_definition(definition):
     Returns:
         (bool): Is the definition embedded.
     """
-    if definition.libraryFilePath() == "Embedded":
-        return True
-
-    return False
+    return definition.libraryFilePath() == _EMBEDDED
 
 
-def using_embedded_definition(current_node):
+def using_embedded_definition(current_node, definition=None):
     """
     Determine if the given hou.Node is using an embedded definition.
 
     Args:
         current_node(hou.Node): The node to check the definition for.
+        definition(:obj:`hou.HDADefinition`,optional): The node's definition, if the
+            caller has already looked it up.
 
     Returns:
         (bool): Is the node using an embedded definition.
     """
-    definition = nodes.definition_from_node(current_node.path())
+    if definition is None:
+        definition = nodes.definition_from_node(current_node.path())
     if definition:
-        return embedded_definition(definition)
+        return definition.libraryFilePath() == _EMBEDDED
 
     return False
 
@@ -70,26 +105,46 @@ def valid_node_type_name(node_type_name):
     Returns:
         (bool): Is the node type name valid?
     """
-    name_components = node_type_name_components(node_type_name)
-    if len(name_components) >= 3:
-        return True
-
-    return False
+    # Counting separators matches len(split("::")) >= 3 without building the list
+    return node_type_name.count("::") >= 2
 
 
+@functools.lru_cache(maxsize=4096)
 def node_type_name_components(node_type_name):
     """Get the node type components.
 
     A hou.HDADefinition nodeTypeName is formated as follows: namespace::name::version.
-    For a given node type name return a list of the various components.
+    For a given node type name return a tuple of the various components. Results are
+    cached as the same node type names are parsed repeatedly.
 
     Args:
         node_type_name(str): The node type name toy get the components from.
 
     Returns:
-        (list): A list of name components.
+        (tuple): A tuple of name components.
     """
-    return node_type_name.split("::")
+    return tuple(node_type_name.split("::"))
+
+
+@functools.lru_cache(maxsize=4096)
+def split_node_type_name(node_type_name):
+    """Get the node type namespace, name and version from a single parse.
+
+    Matches node_type_namespace, node_type_name and node_type_version without any new
+    components, which all read from these cached results.
+
+    Args:
+        node_type_name(str): The node type name to split.
+
+    Returns:
+        (tuple): The namespace, name and version. For an invalid node type name the
+            namespace and version are None and the name is the full node type name.
+    """
+    name_sections = node_type_name_components(node_type_name)
+    if len(name_sections) < 3:
+        return None, node_type_name, None
+
+    return name_sections[-3:]
 
 
 def node_type_namespace(node_type_name, new_namespace=None):
@@ -108,11 +163,11 @@ def node_type_namespace(node_type_name, new_namespace=None):
     if new_namespace:
         return new_namespace
 
-    if valid_node_type_name(node_type_name):
-        name_sections = node_type_name_components(node_type_name)
-        return name_sections[-3]
+    # Names without a separator can't be valid, so skip the lookup
+    if "::" not in node_type_name:
+        return None
 
-    return None
+    return split_node_type_name(node_type_name)[0]
 
 
 def node_type_name(node_type_name, new_name=None):
@@ -131,11 +186,11 @@ def node_type_name(node_type_name, new_name=None):
     if new_name:
         return new_name
 
-    if valid_node_type_name(node_type_name):
-        name_sections = node_type_name_components(node_type_name)
-        return name_sections[-2]
+    # Names without a separator can't be valid, so skip the lookup
+    if "::" not in node_type_name:
+        return node_type_name
 
-    return node_type_name
+    return split_node_type_name(node_type_name)[1]
 
 
 def node_type_version(node_type_name, new_version=None):
@@ -154,11 +209,11 @@ def node_type_version(node_type_name, new_version=None):
     if new_version:
         return new_version
 
-    if valid_node_type_name(node_type_name):
-        name_sections = node_type_name_components(node_type_name)
-        return name_sections[-1]
+    # Names without a separator can't be valid, so skip the lookup
+    if "::" not in node_type_name:
+        return None
 
-    return None
+    return split_node_type_name(node_type_name)[2]
 
 
 def node_type_index(node_type_name, category):
@@ -177,14 +232,35 @@ def node_type_index(node_type_name, category):
     index = None
     if valid_node_type_name(node_type_name):
         name_sections = node_type_name_components(node_type_name)
-        name_sections[-2] = "{category}/{name}".format(
-            category=category, name=name_sections[-2]
+        index = sys.intern(
+            "::".join(name_sections[:-2] + (f"{category}/{name_sections[-2]}",))
         )
-        index = "::".join(name_sections[:-1])
 
     return index
 
 
+def parse_node_type_components(node_type_name, category):
+    """Get the node type index, name, namespace and version.
+
+    Equivalent to calling node_type_index, node_type_name, node_type_namespace and
+    node_type_version, but only splitting the node type name once.
+
+    Args:
+        node_type_name(str): The full node type name to parse.
+        category(str): The node type category used to generate the index.
+
+    Returns:
+        (tuple): The index, name, namespace and version of the node type.
+    """
+    name_sections = node_type_name_components(node_type_name)
+    if len(name_sections) < 3:
+        return None, node_type_name, None, None
+
+    namespace, name, version = name_sections[-3:]
+    index = sys.intern("::".join(name_sections[:-2] + (f"{category}/{name}",)))
+    return index, name, namespace, version
+
+
 def node_type_index_from_components(namespace, name, category):
     """Generate a node type index.
 
@@ -199,9 +275,7 @@ def node_type_index_from_components(namespace, name, category):
     Returns:
         index(str): The node type index based on the given criteria.
     """
-    index = "{namespace}::{category}/{name}".format(
-        namespace=namespace, category=category, name=name
-    )
+    index = sys.intern(f"{namespace}::{category}/{name}")
     return index
 
 
@@ -221,13 +295,13 @@ def node_type_name_from_components(definition, namespace=None, name=None, versio
     Returns:
         (str): The updated node type name.
     """
-    current_name = definition.nodeTypeName()
-    new_namespace = node_type_namespace(current_name, new_namespace=namespace)
-    new_name = node_type_name(current_name, new_name=name)
-    new_version = node_type_version(current_name, new_version=version)
-    return "{namespace}::{name}::{version}".format(
-        namespace=new_namespace, name=new_name, version=new_version
+    current_namespace, current_name, current_version = split_node_type_name(
+        definition.nodeTypeName()
     )
+    namespace = namespace or current_namespace
+    name = name or current_name
+    version = version or current_version
+    return sys.intern(f"{namespace}::{name}::{version}")
 
 
 def editable_hda_path_from_components(definition, edit_dir, namespace=None, name=None):
@@ -240,28 +314,41 @@ def editable_hda_path_from_components(definition, edit_dir, namespace=None, name
     Args:
         definition(hou.HDADefinition): The HDA definition to generate the editable HDA
             path for.
-        edit_dir(str): The root edit directory.
+        edit_dir(str): The root edit directory, without a trailing separator.
         namespace(str): The updated namespace to use if it is being changed.
         name(str): The updated name to use if it is being changed.
 
     Returns:
         (str): The editable HDA path on disk.
     """
-    category = definition.nodeTypeCategory()
+    category = definition.nodeTypeCategory().name()
     current_name = definition.nodeTypeName()
+    timestamp = time.time_ns() // 1_000_000_000
     if valid_node_type_name(current_name):
         # If the name is valid, use it
-        new_namespace = node_type_namespace(current_name, new_namespace=namespace)
-        new_name = node_type_name(current_name, new_name=name)
-        full_name = "{namespace}_{name}".format(namespace=new_namespace, name=new_name)
+        current_namespace, current_node_name, _ = split_node_type_name(current_name)
+        namespace = namespace or current_namespace
+        name = name or current_node_name
+        editable_name = f"{category}_{namespace}_{name}.{timestamp}.hda"
     else:
         # Otherwise just make do with whatever we have
-        full_name = definition.nodeTypeName()
+        editable_name = f"{category}_{current_name}.{timestamp}.hda"
+
+    # The filename is a plain basename, so join without os.path.join's checks
+    return f"{edit_dir}{os.sep}{editable_name}"
 
-    editable_name = "{category}_{full_name}.{time}.hda".format(
-        category=category.name(), full_name=full_name, time=int(time.time())
-    )
-    return os.path.join(edit_dir, editable_name)
+
+def definition_components(definition):
+    """Get the category, namespace, name and version of the given definition.
+
+    Args:
+        definition(hou.HDADefinition): The HDA definition to get the components for.
+
+    Returns:
+        (tuple): The category, namespace, name and version of the definition.
+    """
+    namespace, name, version = split_node_type_name(definition.nodeTypeName())
+    return definition.nodeTypeCategory().name(), namespace, name, version
 
 
 def release_branch_name(definition):
@@ -274,20 +361,9 @@ def release_branch_name(definition):
     Returns:
         (str): The git release branch for the given definition.
     """
-    category = definition.nodeTypeCategory().name()
-    current_name = definition.nodeTypeName()
-    namespace = node_type_namespace(current_name)
-    name = node_type_name(current_name)
-    version = node_type_version(current_name)
-    ts = time.gmtime()
-    release_time = time.strftime("%d-%m-%y-%H-%M-%S", ts)
-    return "release_{category}-{namespace}-{name}-{version}-{time}".format(
-        category=category,
-        namespace=namespace,
-        name=name,
-        version=version,
-        time=release_time,
-    )
+    category, namespace, name, version = definition_components(definition)
+    release_time = time.strftime(_RELEASE_TIME_FORMAT, time.gmtime())
+    return f"release_{category}-{namespace}-{name}-{version}-{release_time}"
 
 
 def expanded_hda_name(definition):
@@ -304,13 +380,8 @@ def expanded_hda_name(definition):
     Returns:
         (str): The expanded HDA name.
     """
-    category = definition.nodeTypeCategory().name()
-    current_name = definition.nodeTypeName()
-    name = node_type_name(current_name)
-    namespace = node_type_namespace(current_name)
-    return "{category}_{namespace}_{name}.hda".format(
-        category=category, namespace=namespace, name=name
-    )
+    category, namespace, name, _ = definition_components(definition)
+    return f"{category}_{namespace}_{name}.hda"
 
 
 def hda_filename(definition):
@@ -344,14 +415,20 @@ def uninstall_definition(definition, backup_dir=None):
 
     # Move the .hda file to backup
     if backup_dir:
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
-        shutil.move(path, backup_dir)
-        logger.debug(
-            "{path} backed-up to {backup}.".format(
-                path=os.path.basename(path), backup=backup_dir
-            )
-        )
+        os.makedirs(backup_dir, exist_ok=True)
+        backup_path = os.path.join(backup_dir, os.path.basename(path))
+        moved = False
+        if not os.path.lexists(backup_path):
+            try:
+                # A rename is enough when the backup dir is on the same filesystem
+                os.rename(path, backup_path)
+                moved = True
+            except OSError:
+                pass
+        if not moved:
+            # Handles other filesystems, and raises if the backup already exists
+            shutil.move(path, backup_dir)
+        logger.debug("%s backed-up to %s.", os.path.basename(path), backup_dir)
 
 
 def cleanup_embedded_definitions(nodetype):
@@ -362,20 +439,21 @@ def cleanup_embedded_definitions(nodetype):
         nodetype(hou.NodeType): The nodetype to clean-up any embedded defintions for.
     """
     for definition in nodetype.allInstalledDefinitions():
-        if embedded_definition(definition) and not definition.isCurrent():
-            definition.destroy()
-            logger.debug(
-                "Embedded definition removed for {name}.".format(
-                    name=nodetype.name(),
-                )
-            )
+        # Check isCurrent() first, to skip the path lookup for the current definition
+        if definition.isCurrent() or definition.libraryFilePath() != _EMBEDDED:
+            continue
+        definition.destroy()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Embedded definition removed for %s.", nodetype.name())
 
 
+@functools.lru_cache(maxsize=1)
 def allow_pipeline():
     """Check if publish is possible to the pipeline HDA repository.
 
     Temporary workaround to add some basic access control to the houdini_hdas_pipeline
-    repository.
+    repository. The config and the user's groups are fixed for the session, so the
+    result is cached.
 
     Returns:
         (bool): Should publish to pipeline repo be allowed?
@@ -383,9 +461,21 @@ def allow_pipeline():
     config = get_config()
     pipeline_group_id = config.get("pipeline_group_id")
 
-    if pipeline_group_id in os.getgroups():
-        return True
-    return False
+    return pipeline_group_id in os.getgroups()
+
+
+def refresh_publish_flags():
+    """Read the publish flags from the REBELLION_HDAS_PUBLISH environment variable.
+
+    The environment doesn't change during a session, so this is run once on import.
+    """
+    global _ALLOW_PUBLISH, _ALLOW_SHOW_PUBLISH
+    publish = os.getenv("REBELLION_HDAS_PUBLISH")
+    _ALLOW_PUBLISH = publish != "lock"
+    _ALLOW_SHOW_PUBLISH = publish == "show"
+
+
+refresh_publish_flags()
 
 
 def allow_publish():
@@ -395,15 +485,7 @@ def allow_publish():
     Returns:
         (bool): Should publishing be allowed?
     """
-    publish = os.getenv("REBELLION_HDAS_PUBLISH")
-
-    if not publish:
-        return True
-
-    if publish != "lock":
-        return True
-
-    return False
+    return _ALLOW_PUBLISH
 
 
 def allow_show_publish():
@@ -412,9 +494,4 @@ def allow_show_publish():
     Returns:
         (bool): Publish possible to the show repository.
     """
-    publish = os.getenv("REBELLION_HDAS_PUBLISH")
-
-    if publish == "show":
-        return True
-
-    return False
+    return _ALLOW_SHOW_PUBLISH